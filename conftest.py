@@ -0,0 +1,38 @@
+"""
+Shared pytest configuration for running the zen3geo test suite.
+"""
+import pytest
+
+
+def pytest_addoption(parser):
+    """
+    Add a --runnetwork command line option to pytest.
+    """
+    parser.addoption(
+        "--runnetwork",
+        action="store_true",
+        default=False,
+        help="run tests needing network access",
+    )
+
+
+def pytest_configure(config):
+    """
+    Register the network marker used on tests that fetch data over HTTP.
+    """
+    config.addinivalue_line(
+        "markers", "network: mark test as needing network access to run"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip tests marked as network unless --runnetwork is given, so that local
+    development loops do not pay TCP and server latency on every run.
+    """
+    if config.getoption("--runnetwork"):
+        return
+    skip_network = pytest.mark.skip(reason="need --runnetwork option to run")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
@@ -0,0 +1,32 @@
+"""
+Shared concurrency helpers for zen3geo's reader DataPipes.
+"""
+import collections
+import concurrent.futures
+import itertools
+from typing import Any, Callable, Iterable, Iterator
+
+
+def _threaded_map(
+    fn: Callable, iterable: Iterable, num_workers: int, **kwargs: Any
+) -> Iterator:
+    """
+    Map ``fn`` over ``iterable`` using a pool of ``num_workers`` threads,
+    keeping a bounded read-ahead window (twice the worker count) of in-flight
+    calls and yielding results in the original input order.
+
+    Used by reader DataPipes whose underlying libraries release the GIL
+    during I/O (e.g. GDAL reads, HTTP requests), so that fetching item N+k
+    overlaps with downstream processing of item N.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+        items = iter(iterable)
+        futures = collections.deque(
+            executor.submit(fn, item, **kwargs)
+            for item in itertools.islice(items, 2 * num_workers)
+        )
+        while futures:
+            result = futures.popleft().result()
+            for item in itertools.islice(items, 1):
+                futures.append(executor.submit(fn, item, **kwargs))
+            yield result
@@ -1,6 +1,10 @@
 """
 DataPipes for :doc:`datashader <datashader:index>`.
 """
+import copy
+import functools
+import itertools
+import math
 from typing import Any, Dict, Iterator, Optional, Union
 
 try:
@@ -8,6 +12,7 @@ try:
 except ImportError:
     datashader = None
 try:
+    import pyarrow
     import spatialpandas
     from spatialpandas.geometry import (
         LineDtype,
@@ -17,14 +22,78 @@ try:
         PointDtype,
         PolygonDtype,
     )
+
+    # Map each spatialpandas geometry dtype to the datashader.Canvas
+    # aggregation method that rasterizes it
+    _CANVAS_METHOD_BY_DTYPE = {
+        PointDtype: "points",
+        MultiPointDtype: "points",
+        LineDtype: "line",
+        MultiLineDtype: "line",
+        PolygonDtype: "polygons",
+        MultiPolygonDtype: "polygons",
+    }
 except ImportError:
     spatialpandas = None
+try:
+    import dask
+except ImportError:
+    dask = None
+try:
+    import numba
+except ImportError:
+    numba = None
+try:
+    import shapely
+except ImportError:
+    shapely = None
 
+import numpy as np
+import pandas as pd
+import rasterio.crs
 import xarray as xr
 from torchdata.datapipes import functional_datapipe
 from torchdata.datapipes.iter import IterDataPipe
 
 
+def _convert_to_dataframe(geometry):
+    """
+    Convert a :py:class:`geopandas.GeoSeries` into a dataframe format that
+    datashader can aggregate. Point geometries take a fast path that
+    transfers the raw coordinate buffer via
+    :py:func:`shapely.to_ragged_array` into a plain
+    :py:class:`pandas.DataFrame` with 'x' and 'y' columns (datashader's
+    fastest input format), skipping the spatialpandas wrapper entirely.
+    LineString geometries are wrapped into a
+    :py:class:`spatialpandas.geometry.LineArray` built directly on the
+    ragged coordinate buffer as a :py:class:`pyarrow.ListArray`, instead of
+    spatialpandas' per-geometry ``from_geopandas`` traversal. Other geometry
+    types go through the regular :py:class:`spatialpandas.GeoDataFrame`
+    constructor.
+    """
+    if (
+        shapely is not None
+        and hasattr(shapely, "to_ragged_array")  # shapely>=2.0
+        and len(geometry) > 0
+    ):
+        geom_type = geometry.geom_type
+        if (geom_type == "Point").all():
+            _, coords, _ = shapely.to_ragged_array(geometries=geometry.values)
+            return pd.DataFrame(data={"x": coords[:, 0], "y": coords[:, 1]})
+        if (geom_type == "LineString").all():
+            _, coords, (offsets,) = shapely.to_ragged_array(geometries=geometry.values)
+            # spatialpandas stores lines as lists of interleaved x/y floats,
+            # so the per-geometry offsets into the flat buffer are doubled
+            lines = spatialpandas.geometry.LineArray(
+                pyarrow.ListArray.from_arrays(
+                    offsets=pyarrow.array(obj=(offsets * 2).astype("int32")),
+                    values=pyarrow.array(obj=coords.ravel()),
+                )
+            )
+            return spatialpandas.GeoDataFrame(data={"geometry": lines})
+    return spatialpandas.GeoDataFrame(data=geometry)
+
+
 @functional_datapipe("rasterize_with_datashader")
 class DatashaderRasterizerIterDataPipe(IterDataPipe):
     """
@@ -34,6 +103,20 @@ class DatashaderRasterizerIterDataPipe(IterDataPipe):
     raster with the input geometries aggregated into a fixed-sized grid
     (functional name: ``rasterize_with_datashader``).
 
+    Note
+    ----
+    Rasterization runs serially with respect to the upstream canvas and
+    vector producers. To overlap upstream I/O (e.g. reading vector files)
+    with the datashader aggregation compute, wrap the upstream datapipe with
+    torchdata's :py:class:`Prefetcher <torchdata.datapipes.iter.Prefetcher>`,
+    e.g. ``source_datapipe.prefetch(buffer_size=2)``, which fetches items in
+    a background thread. To spread rasterization itself over several CPU
+    cores, either set the ``scheduler`` parameter below, or shard the
+    pipeline across DataLoader worker processes by appending
+    ``.sharding_filter()`` after this datapipe and running it under a
+    ``MultiProcessingReadingService`` (remember to set ``num_threads`` so
+    each worker does not oversubscribe numba threads).
+
     Parameters
     ----------
     source_datapipe : IterDataPipe[datashader.Canvas]
@@ -57,6 +140,40 @@ class DatashaderRasterizerIterDataPipe(IterDataPipe):
         For more information, refer to the section on Aggregation under
         datashader's :doc:`datashader:getting_started/Pipeline` docs.
 
+    num_threads : Optional[int]
+        Number of threads numba may use for datashader's parallel
+        aggregation kernels. Set this to a small number (e.g. ``1``) when
+        using this datapipe inside a :py:class:`torch.utils.data.DataLoader`
+        with multiple worker processes, where each worker would otherwise
+        spawn ``os.cpu_count()`` numba threads and oversubscribe the CPU.
+        Default is ``None`` (leave numba's thread count untouched).
+
+    max_canvas_pixels : Optional[int]
+        Maximum number of pixels to rasterize at full resolution. Canvases
+        with more pixels than this will be aggregated at a reduced
+        resolution and upsampled back to the requested grid using
+        nearest-neighbour lookup. This is an accuracy/speed trade-off knob
+        for oversized canvases; aggregated counts are replicated (not
+        redistributed) across the upsampled pixels. Default is ``None``
+        (always rasterize at full resolution).
+
+    scheduler : Optional[str]
+        Dask scheduler to use for rasterizing independent (canvas, vector)
+        pairs in parallel batches, e.g. ``'threads'``. Each batch of eight
+        pairs is submitted via :py:func:`dask.delayed` and computed together.
+        Requires ``dask`` to be installed. Default is ``None`` (rasterize
+        sequentially on the main thread, which is best when this datapipe
+        already runs inside parallel DataLoader workers).
+
+    chunks : Optional[dict]
+        A dictionary mapping dimension names to chunk sizes, e.g.
+        ``{'y': 512, 'x': 512}``. If set, the rasterized output will be
+        converted into a :py:class:`dask.array.Array` backed
+        :py:class:`xarray.DataArray` using :py:meth:`xarray.DataArray.chunk`,
+        so that downstream operations (e.g. slicing with ``xbatcher``) stay
+        lazy and memory-bound. Default is ``None`` (eager numpy-backed
+        output).
+
     kwargs : Optional
         Extra keyword arguments to pass to the :py:class:`datashader.Canvas`
         class's aggregation methods such as ``datashader.Canvas.points``.
@@ -159,6 +276,10 @@ class DatashaderRasterizerIterDataPipe(IterDataPipe):
         source_datapipe: IterDataPipe,
         vector_datapipe: IterDataPipe,
         agg: Optional = None,
+        num_threads: Optional[int] = None,
+        scheduler: Optional[str] = None,
+        max_canvas_pixels: Optional[int] = None,
+        chunks: Optional[Dict[str, int]] = None,
         **kwargs: Optional[Dict[str, Any]],
     ) -> None:
         if spatialpandas is None:
@@ -171,7 +292,36 @@ class DatashaderRasterizerIterDataPipe(IterDataPipe):
         self.source_datapipe: IterDataPipe = source_datapipe  # datashader.Canvas
         self.vector_datapipe: IterDataPipe = vector_datapipe  # geopandas.GeoDataFrame
         self.agg: Optional = agg  # Datashader Aggregation/Reduction function
+        self.num_threads: Optional[int] = num_threads
+        if scheduler is not None and dask is None:
+            raise ModuleNotFoundError(
+                "Package `dask` is required to be installed to use the "
+                "`scheduler` setting of this datapipe. "
+                "Please use `pip install dask` or "
+                "`conda install -c conda-forge dask` "
+                "to install the package"
+            )
+        self.scheduler: Optional[str] = scheduler
+        self.max_canvas_pixels: Optional[int] = max_canvas_pixels
+        if chunks is not None and dask is None:
+            raise ModuleNotFoundError(
+                "Package `dask` is required to be installed to use the "
+                "`chunks` setting of this datapipe. "
+                "Please use `pip install dask` or "
+                "`conda install -c conda-forge dask` "
+                "to install the package"
+            )
+        self.chunks: Optional[Dict[str, int]] = chunks
         self.kwargs = kwargs
+        # Pre-merge the keyword arguments passed to the datashader.Canvas
+        # aggregation methods, so the dict merge is not redone per iteration
+        self._agg_kwargs: Dict[str, Any] = dict(
+            agg=self.agg, geometry="geometry", **self.kwargs
+        )
+        # Variant for the plain x/y pandas.DataFrame point fast path
+        self._agg_kwargs_xy: Dict[str, Any] = dict(
+            agg=self.agg, x="x", y="y", **self.kwargs
+        )
 
         len_vector_datapipe: int = len(self.vector_datapipe)
         len_canvas_datapipe: int = len(self.source_datapipe)
@@ -183,27 +333,90 @@ class DatashaderRasterizerIterDataPipe(IterDataPipe):
                 f"be (1) to allow for broadcasting, or match the canvas datapipe's "
                 f"length of ({len_canvas_datapipe})."
             )
+        # Whether to broadcast 1 vector to N canvases. The single vector is
+        # fetched lazily on first iteration (and then kept), so that
+        # constructing the datapipe does not execute the upstream vector
+        # pipeline
+        self._broadcast: bool = len_vector_datapipe == 1
+        self._fill_vector = None
+        # Parsed rasterio.crs.CRS objects keyed by the raw canvas.crs
+        # value, so the CRS string is not re-parsed on every write_crs call
+        self._crs_cache: Dict[Any, rasterio.crs.CRS] = {}
+        # Cache of reprojected and converted spatialpandas.GeoDataFrame
+        # objects, keyed by coordinate reference system. Only used when
+        # broadcasting 1 vector to N canvases, where the same vector would
+        # otherwise be reprojected and converted on every iteration
+        self._spatialpandas_cache: dict = {}
 
     def __iter__(self) -> Iterator[xr.DataArray]:
-        # Broadcast vector iterator to match length of raster iterator
-        for canvas, vector in self.source_datapipe.zip_longest(
-            self.vector_datapipe, fill_value=list(self.vector_datapipe).pop()
-        ):
-            # print(canvas, vector)
-            # If canvas has no CRS attribute, set one to prevent AttributeError
-            canvas.crs = getattr(canvas, "crs", None)
-            if canvas.crs is None:
-                raise AttributeError(
-                    "Missing crs information for datashader.Canvas with "
-                    f"x_range: {canvas.x_range} and y_range: {canvas.y_range}. "
-                    "Please set crs using e.g. `canvas.crs = 'OGC:CRS84'`."
-                )
+        # Pin the number of threads used by datashader's numba-JIT'd
+        # aggregation kernels for the duration of the iteration, restoring
+        # the previous setting afterwards
+        prev_num_threads: Optional[int] = None
+        if self.num_threads is not None and numba is not None:
+            prev_num_threads = numba.get_num_threads()
+            numba.set_num_threads(self.num_threads)
+        try:
+            yield from self._iter_rasters()
+        finally:
+            if prev_num_threads is not None:
+                numba.set_num_threads(prev_num_threads)
+
+    def _iter_rasters(self) -> Iterator[xr.DataArray]:
+        if self._broadcast:
+            # Broadcast single vector to match length of canvas iterator
+            if self._fill_vector is None:
+                self._fill_vector = next(iter(self.vector_datapipe))
+            paired_datapipe = (
+                (canvas, self._fill_vector) for canvas in self.source_datapipe
+            )
+        else:
+            paired_datapipe = self.source_datapipe.zip(self.vector_datapipe)
+        if self.scheduler is None:
+            for canvas, vector in paired_datapipe:
+                yield self._rasterize_pair(canvas=canvas, vector=vector)
+        else:
+            # Rasterize pairs in parallel batches with dask. A bounded batch
+            # keeps memory usage in check while still letting the scheduler
+            # overlap independent rasterizations
+            pairs = iter(paired_datapipe)
+            while True:
+                batch = list(itertools.islice(pairs, 8))
+                if not batch:
+                    break
+                tasks = [
+                    dask.delayed(self._rasterize_pair)(canvas=canvas, vector=vector)
+                    for canvas, vector in batch
+                ]
+                yield from dask.compute(*tasks, scheduler=self.scheduler)
+
+    def _rasterize_pair(self, canvas, vector) -> xr.DataArray:
+        """
+        Rasterize a single (canvas, vector) pair into an xarray.DataArray.
+        """
+        # print(canvas, vector)
+        # Read canvas CRS attribute once, None if missing
+        canvas_crs = getattr(canvas, "crs", None)
+        if canvas_crs is None:
+            raise AttributeError(
+                "Missing crs information for datashader.Canvas with "
+                f"x_range: {canvas.x_range} and y_range: {canvas.y_range}. "
+                "Please set crs using e.g. `canvas.crs = 'OGC:CRS84'`."
+            )
 
+        try:
+            # Reuse previously reprojected and converted vector when
+            # broadcasting the same vector onto canvases of the same
+            # coordinate reference system
+            vector, vector_bounds, _vector, vector_dtype = self._spatialpandas_cache[
+                canvas_crs
+            ]
+        except KeyError:
             # Reproject vector geometries to coordinate reference system
             # of the raster canvas if both are different
             try:
-                if vector.crs != canvas.crs:
-                    vector = vector.to_crs(crs=canvas.crs)
+                if vector.crs != canvas_crs:
+                    vector = vector.to_crs(crs=canvas_crs)
             except (AttributeError, ValueError) as e:
                 raise AttributeError(
                     f"Missing crs information for input {vector.__class__} object "
@@ -214,7 +427,7 @@ class DatashaderRasterizerIterDataPipe(IterDataPipe):
             # Convert vector to spatialpandas format to allow datashader's
             # rasterization methods to work
             try:
-                _vector = spatialpandas.GeoDataFrame(data=vector.geometry)
+                _vector = _convert_to_dataframe(geometry=vector.geometry)
             except ValueError as e:
                 if str(e) == "Unable to convert data argument to a GeometryList array":
                     raise NotImplementedError(
@@ -225,35 +438,113 @@ class DatashaderRasterizerIterDataPipe(IterDataPipe):
                 else:
                     raise e
 
-            # Determine geometry type to know which rasterization method to use
-            vector_dtype: spatialpandas.geometry.GeometryDtype = _vector.geometry.dtype
-
-            if isinstance(vector_dtype, (PointDtype, MultiPointDtype)):
-                raster: xr.DataArray = canvas.points(
-                    source=_vector, agg=self.agg, geometry="geometry", **self.kwargs
-                )
-            elif isinstance(vector_dtype, (LineDtype, MultiLineDtype)):
-                raster: xr.DataArray = canvas.line(
-                    source=_vector, agg=self.agg, geometry="geometry", **self.kwargs
+            # Determine geometry type to know which rasterization method
+            # to use. A plain pandas.DataFrame means the x/y point fast
+            # path, marked with a dtype of None
+            vector_dtype: Optional[spatialpandas.geometry.GeometryDtype] = (
+                _vector.geometry.dtype
+                if isinstance(_vector, spatialpandas.GeoDataFrame)
+                else None
+            )
+            vector_bounds = vector.total_bounds  # (xmin, ymin, xmax, ymax)
+
+            if self._broadcast:
+                self._spatialpandas_cache[canvas_crs] = (
+                    vector,
+                    vector_bounds,
+                    _vector,
+                    vector_dtype,
                 )
-            elif isinstance(vector_dtype, (PolygonDtype, MultiPolygonDtype)):
-                raster: xr.DataArray = canvas.polygons(
-                    source=_vector, agg=self.agg, geometry="geometry", **self.kwargs
+
+        # Pre-filter geometries lying fully outside of the canvas extent
+        # using geopandas' R-tree backed `.cx` indexer, so that datashader
+        # does not have to process them. Skipped when the canvas extent
+        # already contains the vector's envelope
+        xmin, xmax = canvas.x_range
+        ymin, ymax = canvas.y_range
+        vxmin, vymin, vxmax, vymax = vector_bounds
+        if vxmin < xmin or vymin < ymin or vxmax > xmax or vymax > ymax:
+            subset = vector.cx[xmin:xmax, ymin:ymax]
+            if 0 < len(subset) < len(vector):
+                _vector = _convert_to_dataframe(geometry=subset.geometry)
+                vector_dtype = (
+                    _vector.geometry.dtype
+                    if isinstance(_vector, spatialpandas.GeoDataFrame)
+                    else None
                 )
 
-            # Convert boolean dtype rasters to uint8 to enable reprojection
-            if raster.dtype == "bool":
-                raster: xr.DataArray = raster.astype(dtype="uint8")
-            # Set coordinate transform for raster and ensure affine
-            # transform is correct (the y-coordinate goes from North to South)
-            raster: xr.DataArray = raster.rio.set_crs(input_crs=canvas.crs)
-            # assert raster.rio.transform().e > 0  # y goes South to North
-            _raster: xr.DataArray = raster.rio.reproject(
-                dst_crs=canvas.crs, shape=raster.rio.shape
+        # Aggregate on a reduced-resolution canvas when the requested
+        # grid exceeds the max_canvas_pixels budget, upsampling back to
+        # the full grid afterwards
+        agg_canvas = canvas
+        n_pixels: int = canvas.plot_width * canvas.plot_height
+        if self.max_canvas_pixels is not None and n_pixels > self.max_canvas_pixels:
+            scale: float = math.sqrt(n_pixels / self.max_canvas_pixels)
+            agg_canvas = datashader.Canvas(
+                plot_width=max(1, int(canvas.plot_width / scale)),
+                plot_height=max(1, int(canvas.plot_height / scale)),
+                x_range=canvas.x_range,
+                y_range=canvas.y_range,
+            )
+
+        if vector_dtype is None:  # plain x/y pandas.DataFrame of points
+            raster: xr.DataArray = agg_canvas.points(
+                source=_vector, **self._agg_kwargs_xy
             )
-            # assert _raster.rio.transform().e < 0  # y goes North to South
+        else:
+            try:
+                method_name = _CANVAS_METHOD_BY_DTYPE[type(vector_dtype)]
+            except KeyError:
+                raise NotImplementedError(
+                    f"Unsupported spatialpandas geometry dtype {vector_dtype}, "
+                    "only point, line or polygon vector geometry types "
+                    "(or their multi- equivalents) are supported."
+                ) from None
+            raster: xr.DataArray = getattr(agg_canvas, method_name)(
+                source=_vector, **self._agg_kwargs
+            )
+
+        if agg_canvas is not canvas:
+            # Nearest-neighbour upsample back onto the full resolution
+            # pixel centres of the requested canvas
+            x_full = (
+                xmin
+                + (xmax - xmin)
+                * (np.arange(canvas.plot_width) + 0.5)
+                / canvas.plot_width
+            )
+            y_full = (
+                ymin
+                + (ymax - ymin)
+                * (np.arange(canvas.plot_height) + 0.5)
+                / canvas.plot_height
+            )
+            raster: xr.DataArray = raster.reindex(x=x_full, y=y_full, method="nearest")
+
+        # Convert boolean dtype rasters to uint8 to enable reprojection.
+        # Since numpy booleans are already 1-byte, reinterpret the buffer
+        # as a zero-copy view instead of allocating a new array
+        if raster.dtype == "bool":
+            raster: xr.DataArray = raster.copy(data=raster.data.view("uint8"))
+        # Set coordinate transform for raster and ensure affine
+        # transform is correct (the y-coordinate goes from North to South)
+        # assert raster.rio.transform().e > 0  # y goes South to North
+        raster: xr.DataArray = raster.isel({raster.rio.y_dim: slice(None, None, -1)})
+        try:
+            parsed_crs = self._crs_cache[canvas_crs]
+        except KeyError:
+            parsed_crs = self._crs_cache.setdefault(
+                canvas_crs, rasterio.crs.CRS.from_user_input(canvas_crs)
+            )
+        _raster: xr.DataArray = raster.rio.write_crs(input_crs=parsed_crs)
+        # assert _raster.rio.transform().e < 0  # y goes North to South
+
+        # Optionally convert to a lazy dask-backed array so that
+        # downstream operations can process the raster chunk by chunk
+        if self.chunks is not None:
+            _raster: xr.DataArray = _raster.chunk(chunks=self.chunks)
 
-            yield _raster
+        return _raster
 
     def __len__(self) -> int:
         return len(self.source_datapipe)
@@ -348,23 +639,55 @@ class XarrayCanvasIterDataPipe(IterDataPipe[Union[xr.DataArray, xr.Dataset]]):
             Union[xr.DataArray, xr.Dataset]
         ] = source_datapipe
         self.kwargs = kwargs
+        # Pre-bind extra keyword arguments to the datashader.Canvas
+        # constructor so they are not re-splatted on every iteration
+        self._canvas_factory = functools.partial(datashader.Canvas, **kwargs)
+        # Template datashader.Canvas objects keyed by shape and extent, so
+        # that streams of identically gridded rasters do not reconstruct the
+        # same canvas over and over. Bounded to a handful of entries with
+        # oldest-first eviction, since tiling workflows where every raster
+        # has a distinct extent would otherwise grow the cache indefinitely
+        self._canvas_cache: Dict[tuple, Any] = {}
+        self._canvas_cache_size: int = 8
 
     def __iter__(self) -> Iterator:
         for dataarray in self.source_datapipe:
-            x_dim: str = dataarray.rio.x_dim
-            y_dim: str = dataarray.rio.y_dim
-            plot_width: int = len(dataarray[x_dim])
-            plot_height: int = len(dataarray[y_dim])
-            xmin, ymin, xmax, ymax = dataarray.rio.bounds()
-
-            canvas = datashader.Canvas(
-                plot_width=plot_width,
-                plot_height=plot_height,
-                x_range=(xmin, xmax),
-                y_range=(ymin, ymax),
-                **self.kwargs,
-            )
-            canvas.crs = dataarray.rio.crs
+            # Derive the canvas shape and spatial extent from the (possibly
+            # cached) affine transform and dimension sizes, instead of
+            # scanning the x/y coordinate arrays which would trigger a
+            # coordinate load on dask-backed inputs
+            plot_width: int = dataarray.rio.width
+            plot_height: int = dataarray.rio.height
+            transform = dataarray.rio.transform()
+            left, top = transform * (0, 0)
+            right, bottom = transform * (plot_width, plot_height)
+
+            x_range = (min(left, right), max(left, right))
+            y_range = (min(top, bottom), max(top, bottom))
+            crs = dataarray.rio.crs
+
+            cache_key: tuple = (plot_width, plot_height, x_range, y_range, crs)
+            try:
+                template = self._canvas_cache[cache_key]
+            except KeyError:
+                if len(self._canvas_cache) >= self._canvas_cache_size:
+                    # Evict the oldest inserted entry to keep the cache bounded
+                    self._canvas_cache.pop(next(iter(self._canvas_cache)))
+                template = self._canvas_cache.setdefault(
+                    cache_key,
+                    self._canvas_factory(
+                        plot_width=plot_width,
+                        plot_height=plot_height,
+                        x_range=x_range,
+                        y_range=y_range,
+                    ),
+                )
+            # Yield a shallow copy so downstream mutation (e.g. setting a
+            # different .crs attribute) does not affect the cached template.
+            # Aggregation buffers are allocated per-call inside datashader,
+            # so sharing the template itself is safe
+            canvas = copy.copy(template)
+            canvas.crs = crs
             yield canvas
 
     def __len__(self) -> int:
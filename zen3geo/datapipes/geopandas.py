@@ -147,6 +147,11 @@ class GeoPandasRectangleClipperIterDataPipe(IterDataPipe):
         self.source_datapipe: IterDataPipe = source_datapipe
         self.mask_datapipe: IterDataPipe[xr.DataArray] = mask_datapipe
         self.kwargs = kwargs
+        # The single vector geodataframe, fetched lazily on first iteration,
+        # plus reprojected copies keyed by target coordinate reference
+        # system so that to_crs runs at most once per distinct raster CRS
+        self._geodataframe = None
+        self._reprojected_cache: dict = {}
 
         len_vector_datapipe: int = len(self.source_datapipe)
         if len_vector_datapipe != 1:
@@ -158,16 +163,23 @@ class GeoPandasRectangleClipperIterDataPipe(IterDataPipe):
             )
 
     def __iter__(self) -> Iterator:
-        geodataframe = list(self.source_datapipe).pop()
+        if self._geodataframe is None:
+            self._geodataframe = next(iter(self.source_datapipe))
+        geodataframe = self._geodataframe
 
         for raster in self.mask_datapipe:
             mask = raster.rio.bounds()
 
-            try:
-                assert geodataframe.crs == raster.rio.crs
+            raster_crs = raster.rio.crs
+            if geodataframe.crs == raster_crs:
                 _geodataframe = geodataframe
-            except AssertionError:
-                _geodataframe = geodataframe.to_crs(crs=raster.rio.crs)
+            else:
+                try:
+                    _geodataframe = self._reprojected_cache[raster_crs]
+                except KeyError:
+                    _geodataframe = self._reprojected_cache.setdefault(
+                        raster_crs, geodataframe.to_crs(crs=raster_crs)
+                    )
 
             clipped_geodataframe = _geodataframe.clip(mask=mask, **self.kwargs)
 
@@ -11,6 +11,8 @@ from torchdata.datapipes import functional_datapipe
 from torchdata.datapipes.iter import IterDataPipe
 from torchdata.datapipes.utils import StreamWrapper
 
+from zen3geo.datapipes._parallel import _threaded_map
+
 
 @functional_datapipe("read_from_pyogrio")
 class PyogrioReaderIterDataPipe(IterDataPipe[StreamWrapper]):
@@ -29,8 +31,27 @@ class PyogrioReaderIterDataPipe(IterDataPipe[StreamWrapper]):
         A DataPipe that contains filepaths or URL links to vector files such as
         FlatGeoBuf, GeoPackage, GeoJSON, etc.
 
+    num_workers : Optional[int]
+        Number of threads used to read ahead on the input files with a
+        :py:class:`concurrent.futures.ThreadPoolExecutor`. GDAL releases the
+        GIL while reading, so multiple files are fetched and decoded in
+        parallel while outputs are still yielded in order. Default is ``None``
+        (read files one by one on the main thread).
+
+    chunk_size : Optional[int]
+        Maximum number of features to read per yielded
+        :py:class:`geopandas.GeoDataFrame`. Files with more features are
+        split into successive chunks using pyogrio's ``skip_features`` and
+        ``max_features`` arguments, bounding peak memory for files too big
+        to load in one go. Note that when set, the datapipe yields one or
+        more chunks per input file, so its length is no longer known
+        upfront and calling ``len()`` will raise a :py:class:`TypeError`.
+        Default is ``None`` (read each file whole).
+
     kwargs : Optional
         Extra keyword arguments to pass to :py:func:`pyogrio.read_dataframe`.
+        Tip: pass ``use_arrow=True`` to read via the faster Arrow code path
+        on pyogrio>=0.4.0.
 
     Yields
     ------
@@ -72,7 +93,11 @@ class PyogrioReaderIterDataPipe(IterDataPipe[StreamWrapper]):
     """
 
     def __init__(
-        self, source_datapipe: IterDataPipe[str], **kwargs: Optional[Dict[str, Any]]
+        self,
+        source_datapipe: IterDataPipe[str],
+        num_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        **kwargs: Optional[Dict[str, Any]],
     ) -> None:
         if pyogrio is None:
             raise ModuleNotFoundError(
@@ -82,11 +107,47 @@ class PyogrioReaderIterDataPipe(IterDataPipe[StreamWrapper]):
                 "to install the package"
             )
         self.source_datapipe: IterDataPipe[str] = source_datapipe
+        self.num_workers: Optional[int] = num_workers
+        self.chunk_size: Optional[int] = chunk_size
         self.kwargs = kwargs
 
     def __iter__(self) -> Iterator[StreamWrapper]:
-        for filename in self.source_datapipe:
-            yield StreamWrapper(pyogrio.read_dataframe(filename, **self.kwargs))
+        if self.chunk_size is not None:
+            # Stream each file in feature chunks so that multi-million
+            # feature files never materialize as one giant GeoDataFrame
+            for filename in self.source_datapipe:
+                total_features: int = pyogrio.read_info(filename)["features"]
+                for skip_features in range(0, total_features, self.chunk_size):
+                    yield StreamWrapper(
+                        pyogrio.read_dataframe(
+                            filename,
+                            skip_features=skip_features,
+                            max_features=self.chunk_size,
+                            **self.kwargs,
+                        )
+                    )
+            return
+
+        if self.num_workers is None:
+            for filename in self.source_datapipe:
+                yield StreamWrapper(pyogrio.read_dataframe(filename, **self.kwargs))
+            return
+
+        # Read ahead with a bounded window of in-flight reads, yielding
+        # results in the original order
+        for geodataframe in _threaded_map(
+            fn=pyogrio.read_dataframe,
+            iterable=self.source_datapipe,
+            num_workers=self.num_workers,
+            **self.kwargs,
+        ):
+            yield StreamWrapper(geodataframe)
 
     def __len__(self) -> int:
+        if self.chunk_size is not None:
+            raise TypeError(
+                f"{type(self).__name__} instance doesn't have valid length "
+                "when `chunk_size` is set, as each input file may yield "
+                "several chunks"
+            )
         return len(self.source_datapipe)
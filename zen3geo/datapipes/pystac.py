@@ -5,11 +5,50 @@ from typing import Any, Dict, Iterator, Optional
 
 try:
     import pystac
+    import pystac.stac_io
 except ImportError:
     pystac = None
+try:
+    import requests
+except ImportError:
+    requests = None
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 from torchdata.datapipes import functional_datapipe
 from torchdata.datapipes.iter import IterDataPipe
 
+from zen3geo.datapipes._parallel import _threaded_map
+
+if pystac is not None and requests is not None:
+
+    class _SessionStacIO(pystac.stac_io.DefaultStacIO):
+        """
+        A :py:class:`pystac.stac_io.DefaultStacIO` subclass that fetches
+        http(s) hrefs through a shared :py:class:`requests.Session`, reusing
+        keep-alive connections across STAC items instead of paying a fresh
+        TCP/TLS handshake per item. Non-http hrefs (e.g. local files) fall
+        back to the default reader.
+        """
+
+        def __init__(self, session: Optional[Any] = None):
+            super().__init__()
+            self._session = session if session is not None else requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+
+        def read_text_from_href(self, href: str) -> str:
+            if href.startswith(("http://", "https://")):
+                response = self._session.get(url=href)
+                response.raise_for_status()
+                return response.text
+            return super().read_text_from_href(href)
+
+else:
+    _SessionStacIO = None
+
 
 @functional_datapipe("read_to_pystac_item")
 class PySTACItemReaderIterDataPipe(IterDataPipe):
@@ -23,8 +62,33 @@ class PySTACItemReaderIterDataPipe(IterDataPipe):
     source_datapipe : IterDataPipe[str]
         A DataPipe that contains filepaths or URL links to STAC items.
 
+    num_workers : Optional[int]
+        Number of threads used to fetch STAC items concurrently with a
+        :py:class:`concurrent.futures.ThreadPoolExecutor`, hiding the
+        network round-trip latency of per-item HTTP GET requests. Outputs
+        are still yielded in the original order. Default is ``None`` (fetch
+        items one by one on the main thread).
+
+    cache_path : Optional[str]
+        Path (without extension) of a local sqlite database used to cache
+        the fetched STAC JSON documents via
+        :py:class:`requests_cache.CachedSession`, e.g. ``'.zen3geo_stac'``.
+        Repeated pipeline runs reading the same items are then served from
+        local disk instead of refetching identical JSON over the network.
+        Requires the ``requests-cache`` package to be installed. Default is
+        ``None`` (no caching, use a plain keep-alive HTTP session).
+
+    cache_ttl : Optional[float]
+        Number of seconds after which cached responses expire. Server
+        ``Cache-Control`` headers take precedence when present. Only used
+        when ``cache_path`` is set. Default is ``3600`` (one hour).
+
     kwargs : Optional
         Extra keyword arguments to pass to :py:meth:`pystac.Item.from_file`.
+        Unless a ``stac_io`` is supplied here, http(s) hrefs are read through
+        a shared keep-alive :py:class:`requests.Session` (when ``requests``
+        is installed), so repeated fetches from the same STAC server reuse
+        one connection.
 
     Yields
     ------
@@ -76,7 +140,12 @@ class PySTACItemReaderIterDataPipe(IterDataPipe):
     """
 
     def __init__(
-        self, source_datapipe: IterDataPipe[str], **kwargs: Optional[Dict[str, Any]]
+        self,
+        source_datapipe: IterDataPipe[str],
+        num_workers: Optional[int] = None,
+        cache_path: Optional[str] = None,
+        cache_ttl: Optional[float] = 3600,
+        **kwargs: Optional[Dict[str, Any]],
     ) -> None:
         if pystac is None:
             raise ModuleNotFoundError(
@@ -86,11 +155,46 @@ class PySTACItemReaderIterDataPipe(IterDataPipe):
                 "to install the package"
             )
         self.source_datapipe: IterDataPipe[str] = source_datapipe
+        self.num_workers: Optional[int] = num_workers
         self.kwargs = kwargs
+        session = None
+        if cache_path is not None:
+            if requests_cache is None:
+                raise ModuleNotFoundError(
+                    "Package `requests_cache` is required to be installed to use "
+                    "the `cache_path` setting of this datapipe. "
+                    "Please use `pip install requests-cache` or "
+                    "`conda install -c conda-forge requests-cache` "
+                    "to install the package"
+                )
+            # Serve repeated item fetches from a disk-backed cache instead of
+            # refetching identical STAC JSON over the network on every run
+            session = requests_cache.CachedSession(
+                cache_name=cache_path,
+                backend="sqlite",
+                expire_after=cache_ttl,
+                cache_control=True,
+            )
+        # Read STAC items through a shared keep-alive HTTP session (when
+        # `requests` is available), so that many items fetched from the same
+        # host reuse one connection instead of re-handshaking per item
+        if "stac_io" not in self.kwargs and _SessionStacIO is not None:
+            self.kwargs["stac_io"] = _SessionStacIO(session=session)
 
     def __iter__(self) -> Iterator:
-        for href in self.source_datapipe:
-            yield pystac.Item.from_file(href=href, **self.kwargs)
+        if self.num_workers is None:
+            for href in self.source_datapipe:
+                yield pystac.Item.from_file(href=href, **self.kwargs)
+            return
+
+        # Fetch ahead with a bounded window of in-flight HTTP requests,
+        # yielding items in the original order
+        yield from _threaded_map(
+            fn=pystac.Item.from_file,
+            iterable=self.source_datapipe,
+            num_workers=self.num_workers,
+            **self.kwargs,
+        )
 
     def __len__(self) -> int:
         return len(self.source_datapipe)
@@ -1,15 +1,53 @@
 """
 DataPipes for :doc:`pystac-client <pystac_client:index>`.
 """
+import functools
 from typing import Any, Dict, Iterator, Optional
 
 try:
     import pystac_client
+    from pystac_client.stac_api_io import StacApiIO
 except ImportError:
     pystac_client = None
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 from torchdata.datapipes import functional_datapipe
 from torchdata.datapipes.iter import IterDataPipe
 
+from zen3geo.datapipes._parallel import _threaded_map
+
+
+@functools.lru_cache(maxsize=16)
+def _open_catalog_cached(url: str, kwargs_items: tuple):
+    return pystac_client.Client.open(url=url, **dict(kwargs_items))
+
+
+def _open_catalog(url: str, kwargs: dict):
+    """
+    Open a :py:class:`pystac_client.Client`, memoized on the catalog URL and
+    keyword arguments so that several datapipe instances pointing at the
+    same catalog share one opened client (and its root JSON + conformance
+    fetch). Falls back to an uncached open when the keyword arguments are
+    unhashable (e.g. a headers dict).
+    """
+    try:
+        return _open_catalog_cached(url, tuple(sorted(kwargs.items())))
+    except TypeError:
+        return pystac_client.Client.open(url=url, **kwargs)
+
+
+def _list_items(item_search, as_dicts: bool = False) -> list:
+    """
+    Materialize all :py:class:`pystac.Item` objects (or their raw JSON
+    dicts) of a deferred :py:class:`pystac_client.ItemSearch` query, walking
+    its paginated ``next`` links.
+    """
+    if as_dicts:
+        return list(item_search.items_as_dicts())
+    return list(item_search.items())
+
 
 @functional_datapipe("search_for_pystac_item")
 class PySTACAPISearcherIterDataPipe(IterDataPipe):
@@ -41,6 +79,21 @@ class PySTACAPISearcherIterDataPipe(IterDataPipe):
     catalog_url : str
         The URL of a STAC Catalog.
 
+    cache_path : Optional[str]
+        Path (without extension) of a local sqlite database used to cache
+        the catalog and search HTTP responses via
+        :py:class:`requests_cache.CachedSession`, e.g.
+        ``'.zen3geo_stac'``. Repeated pipeline runs with the same queries
+        then hit local disk instead of refetching identical catalog JSON
+        and search pages over the network. Requires the ``requests-cache``
+        package to be installed. Default is ``None`` (no caching, use a
+        plain HTTP session).
+
+    cache_ttl : Optional[float]
+        Number of seconds after which cached responses expire. Server
+        ``Cache-Control`` headers take precedence when present. Only used
+        when ``cache_path`` is set. Default is ``3600`` (one hour).
+
     kwargs : Optional
         Extra keyword arguments to pass to
         :py:meth:`pystac_client.Client.open`. For example:
@@ -111,6 +164,8 @@ class PySTACAPISearcherIterDataPipe(IterDataPipe):
         self,
         source_datapipe: IterDataPipe[dict],
         catalog_url: str,
+        cache_path: Optional[str] = None,
+        cache_ttl: Optional[float] = 3600,
         **kwargs: Optional[Dict[str, Any]]
     ) -> None:
         if pystac_client is None:
@@ -123,9 +178,36 @@ class PySTACAPISearcherIterDataPipe(IterDataPipe):
         self.source_datapipe: IterDataPipe[dict] = source_datapipe
         self.catalog_url: str = catalog_url
         self.kwargs = kwargs
+        if cache_path is not None:
+            if requests_cache is None:
+                raise ModuleNotFoundError(
+                    "Package `requests_cache` is required to be installed to use "
+                    "the `cache_path` setting of this datapipe. "
+                    "Please use `pip install requests-cache` or "
+                    "`conda install -c conda-forge requests-cache` "
+                    "to install the package"
+                )
+            # Swap the plain requests.Session inside pystac-client's StacApiIO
+            # for a disk-backed caching session, so the root catalog JSON and
+            # repeated search pages are served from sqlite instead of refetched
+            stac_io = StacApiIO(headers=self.kwargs.get("headers"))
+            stac_io.session = requests_cache.CachedSession(
+                cache_name=cache_path,
+                backend="sqlite",
+                expire_after=cache_ttl,
+                allowable_methods=("GET", "POST"),
+                cache_control=True,
+            )
+            self.kwargs["stac_io"] = stac_io
+        # The opened catalog client, fetched lazily on first iteration and
+        # kept, so that re-iterations (e.g. multi-epoch DataLoader runs) do
+        # not refetch the root catalog JSON and conformance classes
+        self._catalog = None
 
     def __iter__(self) -> Iterator:
-        catalog = pystac_client.Client.open(url=self.catalog_url, **self.kwargs)
+        if self._catalog is None:
+            self._catalog = _open_catalog(url=self.catalog_url, kwargs=self.kwargs)
+        catalog = self._catalog
 
         for query in self.source_datapipe:
             search = catalog.search(**query)
@@ -149,6 +231,24 @@ class PySTACAPIItemListerIterDataPipe(IterDataPipe):
         a deferred query to a STAC search endpoint as described in the
         `STAC API - Item Search spec <https://github.com/radiantearth/stac-api-spec/tree/main/item-search>`_.
 
+    num_workers : Optional[int]
+        Number of threads used to execute several searches' paginated HTTP
+        requests concurrently with a
+        :py:class:`concurrent.futures.ThreadPoolExecutor`, so that one
+        search's pagination overlaps another's network wait. Items are
+        still yielded in the original search order. Default is ``None``
+        (walk each search's pages one by one on the main thread).
+
+    as_dicts : bool
+        Yield each matched item as its raw JSON ``dict`` (via
+        :py:meth:`pystac_client.ItemSearch.items_as_dicts`) instead of a
+        full :py:class:`pystac.Item`. Skips instantiating Links, Assets
+        and extension objects per item - hundreds of Python allocations -
+        which is worthwhile when downstream code only reads a few fields
+        like asset hrefs, and keeps records cheaply picklable across
+        DataLoader workers. Default is ``False`` (yield
+        :py:class:`pystac.Item` objects).
+
     Yields
     ------
     stac_item : pystac.Item
@@ -215,7 +315,12 @@ class PySTACAPIItemListerIterDataPipe(IterDataPipe):
      'datetime': '2023-01-03T06:24:53Z'}
     """
 
-    def __init__(self, source_datapipe):
+    def __init__(
+        self,
+        source_datapipe,
+        num_workers: Optional[int] = None,
+        as_dicts: bool = False,
+    ):
         if pystac_client is None:
             raise ModuleNotFoundError(
                 "Package `pystac_client` is required to be installed to use this datapipe. "
@@ -224,10 +329,34 @@ class PySTACAPIItemListerIterDataPipe(IterDataPipe):
                 "to install the package"
             )
         self.source_datapipe = source_datapipe
+        self.num_workers: Optional[int] = num_workers
+        self.as_dicts: bool = as_dicts
+        # Total matched item count, computed once on first len() call since
+        # each matched() lookup costs an HTTP request per search
+        self._len: Optional[int] = None
 
     def __iter__(self):
-        for item_search in self.source_datapipe:
-            yield from item_search.items()
+        if self.num_workers is None:
+            for item_search in self.source_datapipe:
+                if self.as_dicts:
+                    yield from item_search.items_as_dicts()
+                else:
+                    yield from item_search.items()
+            return
+
+        # Paginate several searches concurrently, flattening the per-search
+        # item lists back into one ordered stream
+        for items in _threaded_map(
+            fn=_list_items,
+            iterable=self.source_datapipe,
+            num_workers=self.num_workers,
+            as_dicts=self.as_dicts,
+        ):
+            yield from items
 
     def __len__(self):
-        return sum(item_search.matched() for item_search in self.source_datapipe)
+        if self._len is None:
+            self._len = sum(
+                item_search.matched() or 0 for item_search in self.source_datapipe
+            )
+        return self._len
@@ -1,13 +1,17 @@
 """
 DataPipes for :doc:`rioxarray <rioxarray:index>`.
 """
+import contextlib
 from typing import Any, Dict, Iterator, Optional
 
+import rasterio
 import rioxarray
 from torchdata.datapipes import functional_datapipe
 from torchdata.datapipes.iter import IterDataPipe
 from torchdata.datapipes.utils import StreamWrapper
 
+from zen3geo.datapipes._parallel import _threaded_map
+
 
 @functional_datapipe("read_from_rioxarray")
 class RioXarrayReaderIterDataPipe(IterDataPipe[StreamWrapper]):
@@ -26,9 +30,40 @@ class RioXarrayReaderIterDataPipe(IterDataPipe[StreamWrapper]):
         A DataPipe that contains filepaths or URL links to raster files such as
         GeoTIFFs.
 
+    num_workers : Optional[int]
+        Number of threads used to open the input files ahead of time with a
+        :py:class:`concurrent.futures.ThreadPoolExecutor`. GDAL releases the
+        GIL during I/O, so for remote rasters (e.g. Cloud-Optimized
+        GeoTIFFs over HTTP) file N+1 starts downloading while file N is
+        being consumed. Outputs are still yielded in the original order.
+        Default is ``None`` (open files one by one on the main thread).
+
+    gdal_env : Optional[dict]
+        GDAL configuration options applied via :py:class:`rasterio.Env`
+        while the files are opened and read. For repeated remote COG reads,
+        options like ``VSI_CACHE=True``, a larger
+        ``CPL_VSIL_CURL_CACHE_SIZE``, and
+        ``GDAL_DISABLE_READDIR_ON_OPEN='EMPTY_DIR'`` avoid refetching
+        headers and re-listing directories on every open. Default is
+        ``None`` (use the ambient GDAL environment unchanged).
+
+    wrap_stream : bool
+        Whether to wrap the yielded :py:class:`xarray.DataArray` in a
+        :py:class:`torchdata.datapipes.utils.StreamWrapper`. The wrapper
+        proxies every attribute access through ``__getattr__``, which adds
+        Python-level overhead to the thousands of ``.dims``/``.coords``
+        lookups downstream xarray code performs; set this to ``False`` to
+        yield the bare :py:class:`xarray.DataArray` instead. Default is
+        ``True`` (keep the wrapper, for backwards compatibility).
+
     kwargs : Optional
         Extra keyword arguments to pass to :py:func:`rioxarray.open_rasterio`
-        and/or :py:func:`rasterio.open`.
+        and/or :py:func:`rasterio.open`. Tip: pass ``chunks={'x': 1024,
+        'y': 1024}`` (plus ``lock=False``) to get a lazy dask-backed
+        :py:class:`xarray.DataArray` whose tiles are read in parallel by
+        the dask scheduler on compute, instead of a single-threaded eager
+        load - especially worthwhile for Cloud-Optimized GeoTIFFs where
+        each chunk maps to HTTP range requests.
 
     Yields
     ------
@@ -62,16 +97,45 @@ class RioXarrayReaderIterDataPipe(IterDataPipe[StreamWrapper]):
     """
 
     def __init__(
-        self, source_datapipe: IterDataPipe[str], **kwargs: Optional[Dict[str, Any]]
+        self,
+        source_datapipe: IterDataPipe[str],
+        num_workers: Optional[int] = None,
+        gdal_env: Optional[Dict[str, Any]] = None,
+        wrap_stream: bool = True,
+        **kwargs: Optional[Dict[str, Any]],
     ) -> None:
         self.source_datapipe: IterDataPipe[str] = source_datapipe
+        self.num_workers: Optional[int] = num_workers
+        self.gdal_env: Optional[Dict[str, Any]] = gdal_env
+        self.wrap_stream: bool = wrap_stream
         self.kwargs = kwargs
 
     def __iter__(self) -> Iterator[StreamWrapper]:
-        for filename in self.source_datapipe:
-            yield StreamWrapper(
-                rioxarray.open_rasterio(filename=filename, **self.kwargs)
-            )
+        # Optionally skip the StreamWrapper attribute proxy, which taxes
+        # every downstream attribute lookup with a __getattr__ call
+        wrap = StreamWrapper if self.wrap_stream else (lambda obj: obj)
+        gdal_env = (
+            rasterio.Env(**self.gdal_env)
+            if self.gdal_env is not None
+            else contextlib.nullcontext()
+        )
+        with gdal_env:
+            if self.num_workers is None:
+                for filename in self.source_datapipe:
+                    yield wrap(
+                        rioxarray.open_rasterio(filename=filename, **self.kwargs)
+                    )
+                return
+
+            # Open ahead with a bounded window of in-flight reads, yielding
+            # results in the original order
+            for dataarray in _threaded_map(
+                fn=rioxarray.open_rasterio,
+                iterable=self.source_datapipe,
+                num_workers=self.num_workers,
+                **self.kwargs,
+            ):
+                yield wrap(dataarray)
 
     def __len__(self) -> int:
         return len(self.source_datapipe)
@@ -1,6 +1,8 @@
 """
 DataPipes for :doc:`stackstac <stackstac:index>`.
 """
+import functools
+import itertools
 from typing import Any, Dict, Iterator, Optional
 
 import xarray as xr
@@ -9,10 +11,26 @@ try:
     import stackstac
 except ImportError:
     stackstac = None
+try:
+    import dask
+except ImportError:
+    dask = None
 from torchdata.datapipes import functional_datapipe
 from torchdata.datapipes.iter import IterDataPipe
 
 
+def _compute_batches(arrays: Iterator[xr.DataArray], batch_size: int) -> Iterator:
+    """
+    Materialize lazy dask-backed :py:class:`xarray.DataArray` objects in
+    batches with a single :py:func:`dask.compute` call per batch, so that
+    the COG reads of several arrays overlap on the threaded scheduler
+    instead of being triggered one array at a time downstream.
+    """
+    iterator = iter(arrays)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        yield from dask.compute(*batch, scheduler="threads")
+
+
 @functional_datapipe("mosaic_dataarray")
 class StackSTACMosaickerIterDataPipe(IterDataPipe[xr.DataArray]):
     """
@@ -26,6 +44,21 @@ class StackSTACMosaickerIterDataPipe(IterDataPipe[xr.DataArray]):
         A DataPipe that contains :py:class:`xarray.DataArray` objects, with
         e.g. dimensions ("time", "band", "y", "x").
 
+    compute_batch : Optional[int]
+        Materialize this many mosaicked arrays at a time with a single
+        :py:func:`dask.compute` call on the threaded scheduler, instead of
+        yielding lazy arrays whose graphs are re-traversed (re-issuing COG
+        HTTP range reads) every time a downstream consumer slices them.
+        Default is ``None`` (yield lazy dask-backed arrays).
+
+    drop_coords : bool
+        Drop the non-dimension coordinates (per-item STAC metadata fields
+        that stackstac attaches) from each mosaicked array via
+        :py:meth:`xarray.DataArray.reset_coords`. Every downstream chip
+        slice copies these pandas-backed coordinates, which dominates
+        per-chip cost when chip counts are high. Default is ``False``
+        (keep all coordinates).
+
     kwargs : Optional
         Extra keyword arguments to pass to :py:func:`stackstac.mosaic`.
 
@@ -83,7 +116,9 @@ class StackSTACMosaickerIterDataPipe(IterDataPipe[xr.DataArray]):
     def __init__(
         self,
         source_datapipe: IterDataPipe[xr.DataArray],
-        **kwargs: Optional[Dict[str, Any]]
+        compute_batch: Optional[int] = None,
+        drop_coords: bool = False,
+        **kwargs: Optional[Dict[str, Any]],
     ) -> None:
         if stackstac is None:
             raise ModuleNotFoundError(
@@ -93,11 +128,27 @@ class StackSTACMosaickerIterDataPipe(IterDataPipe[xr.DataArray]):
                 "to install the package"
             )
         self.source_datapipe: IterDataPipe = source_datapipe
+        self.compute_batch: Optional[int] = compute_batch
+        self.drop_coords: bool = drop_coords
         self.kwargs = kwargs
+        # Pre-bind extra keyword arguments to stackstac.mosaic so the dict
+        # splat is not redone on every yield
+        self._mosaic_fn = functools.partial(stackstac.mosaic, **kwargs)
+
+    def _mosaic(self, dataarray: xr.DataArray) -> xr.DataArray:
+        mosaic: xr.DataArray = self._mosaic_fn(dataarray)
+        if self.drop_coords:
+            mosaic = mosaic.reset_coords(drop=True)
+        return mosaic
 
     def __iter__(self) -> Iterator[xr.DataArray]:
-        for dataarray in self.source_datapipe:
-            yield stackstac.mosaic(arr=dataarray, **self.kwargs)
+        mosaics = (
+            self._mosaic(dataarray=dataarray) for dataarray in self.source_datapipe
+        )
+        if self.compute_batch is None:
+            yield from mosaics
+        else:
+            yield from _compute_batches(arrays=mosaics, batch_size=self.compute_batch)
 
     def __len__(self) -> int:
         return len(self.source_datapipe)
@@ -115,8 +166,50 @@ class StackSTACStackerIterDataPipe(IterDataPipe[xr.DataArray]):
     source_datapipe : IterDataPipe[pystac.Item]
         A DataPipe that contains :py:class:`pystac.Item` objects.
 
+    compute_batch : Optional[int]
+        Materialize this many stacked datacubes at a time with a single
+        :py:func:`dask.compute` call on the threaded scheduler, instead of
+        yielding lazy arrays whose graphs are re-traversed (re-issuing COG
+        HTTP range reads) every time a downstream consumer slices them.
+        Default is ``None`` (yield lazy dask-backed arrays).
+
+    rechunk_to : Optional[dict]
+        A dimension name to chunk size mapping applied to each stacked
+        datacube via :py:meth:`xarray.DataArray.chunk`, e.g.
+        ``{'time': -1, 'y': 512, 'x': 512}``. stackstac chunks along
+        ``time``/``band``, so a downstream slicer cutting ``(y, x)`` chips
+        touches several chunks per chip; rechunking to the chip size (with
+        ``time`` merged into one block) makes each chip map to a single
+        chunk. Default is ``None`` (keep stackstac's native chunking).
+
+    drop_coords : bool
+        Drop the non-dimension coordinates (per-item STAC metadata fields
+        that stackstac attaches) from each stacked datacube via
+        :py:meth:`xarray.DataArray.reset_coords`. Every downstream chip
+        slice copies these pandas-backed coordinates, which dominates
+        per-chip cost when chip counts are high. Default is ``False``
+        (keep all coordinates).
+
+    cast_to : Optional[numpy.dtype]
+        Cast each stacked datacube to this dtype (lazily, via
+        :py:meth:`xarray.DataArray.astype` with ``copy=False``) right at
+        the stack boundary, e.g. ``numpy.float16`` for ML consumers that
+        train in half precision. stackstac defaults to float64, so a
+        downcast here halves (or quarters) the bytes moved through every
+        downstream stage. Note that integer assets are rescaled/nodata
+        -filled by stackstac before this cast, and very large values can
+        overflow narrow float types. Default is ``None`` (keep
+        stackstac's output dtype; pass ``dtype=`` through to
+        :py:func:`stackstac.stack` to change what it decodes into).
+
     kwargs : Optional
         Extra keyword arguments to pass to :py:func:`stackstac.stack`.
+        Tip: for COG-over-HTTP reads, pass a tuned ``gdal_env`` built from
+        stackstac's defaults, e.g.
+        ``gdal_env=stackstac.DEFAULT_GDAL_ENV.updated(always=dict(
+        GDAL_HTTP_MULTIPLEX="YES", VSI_CACHE="TRUE",
+        CPL_VSIL_CURL_CACHE_SIZE=200_000_000))``, so repeated range reads
+        hit GDAL's connection pool and block cache instead of refetching.
 
     Yields
     ------
@@ -167,7 +260,13 @@ class StackSTACStackerIterDataPipe(IterDataPipe[xr.DataArray]):
     """
 
     def __init__(
-        self, source_datapipe: IterDataPipe, **kwargs: Optional[Dict[str, Any]]
+        self,
+        source_datapipe: IterDataPipe,
+        compute_batch: Optional[int] = None,
+        rechunk_to: Optional[Dict[Any, int]] = None,
+        drop_coords: bool = False,
+        cast_to: Optional[Any] = None,
+        **kwargs: Optional[Dict[str, Any]],
     ) -> None:
         if stackstac is None:
             raise ModuleNotFoundError(
@@ -177,11 +276,33 @@ class StackSTACStackerIterDataPipe(IterDataPipe[xr.DataArray]):
                 "to install the package"
             )
         self.source_datapipe: IterDataPipe = source_datapipe
+        self.compute_batch: Optional[int] = compute_batch
+        self.rechunk_to: Optional[Dict[Any, int]] = rechunk_to
+        self.drop_coords: bool = drop_coords
+        self.cast_to: Optional[Any] = cast_to
         self.kwargs = kwargs
+        # Pre-bind extra keyword arguments to stackstac.stack so the dict
+        # splat is not redone on every yield
+        self._stack_fn = functools.partial(stackstac.stack, **kwargs)
+
+    def _stack(self, stac_items) -> xr.DataArray:
+        datacube: xr.DataArray = self._stack_fn(stac_items)
+        if self.rechunk_to is not None:
+            datacube = datacube.chunk(chunks=self.rechunk_to)
+        if self.drop_coords:
+            datacube = datacube.reset_coords(drop=True)
+        if self.cast_to is not None:
+            datacube = datacube.astype(dtype=self.cast_to, copy=False)
+        return datacube
 
     def __iter__(self) -> Iterator[xr.DataArray]:
-        for stac_items in self.source_datapipe:
-            yield stackstac.stack(items=stac_items, **self.kwargs)
+        datacubes = (
+            self._stack(stac_items=stac_items) for stac_items in self.source_datapipe
+        )
+        if self.compute_batch is None:
+            yield from datacubes
+        else:
+            yield from _compute_batches(arrays=datacubes, batch_size=self.compute_batch)
 
     def __len__(self) -> int:
         return len(self.source_datapipe)
@@ -101,6 +101,10 @@ class XbatcherSlicerIterDataPipe(IterDataPipe[Union[xr.DataArray, xr.Dataset]]):
         ] = source_datapipe
         self.input_dims: Dict[Hashable, int] = input_dims
         self.kwargs = kwargs
+        # Total chip count, computed once on first len() call since counting
+        # re-iterates the upstream datapipe (re-reading COG/Zarr sources)
+        # and rebuilds a BatchGenerator per element
+        self._len: Optional[int] = None
 
     def __iter__(self) -> Iterator[Union[xr.DataArray, xr.Dataset]]:
         for dataarray in self.source_datapipe:
@@ -110,7 +114,11 @@ class XbatcherSlicerIterDataPipe(IterDataPipe[Union[xr.DataArray, xr.Dataset]]):
                 yield chip
 
     def __len__(self) -> int:
-        return sum(
-            len(dataarray.batch.generator(input_dims=self.input_dims, **self.kwargs))
-            for dataarray in self.source_datapipe
-        )
+        if self._len is None:
+            self._len = sum(
+                len(
+                    dataarray.batch.generator(input_dims=self.input_dims, **self.kwargs)
+                )
+                for dataarray in self.source_datapipe
+            )
+        return self._len
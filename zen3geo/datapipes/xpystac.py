@@ -47,6 +47,12 @@ class XpySTACAssetReaderIterDataPipe(IterDataPipe[StreamWrapper]):
 
     kwargs : Optional
         Extra keyword arguments to pass to :py:func:`xarray.open_dataset`.
+        Tip: pass ``chunks="auto"`` to open the asset as a lazy dask-backed
+        dataset instead of eager-loading it into memory on first access -
+        for multi-gigabyte Zarr/NetCDF collections this caps peak memory at
+        one chunk rather than the whole cube. For Zarr assets, adding
+        ``backend_kwargs={"consolidated": True}`` reads the consolidated
+        metadata in one fetch instead of one request per array.
 
     Yields
     ------
@@ -131,6 +137,9 @@ class XpySTACAssetReaderIterDataPipe(IterDataPipe[StreamWrapper]):
         self.source_datapipe: IterDataPipe = source_datapipe
         self.engine: str = engine
         self.kwargs = kwargs
+        # Memoized length, since len() on a chained upstream datapipe can
+        # trigger a probing pass over the sources
+        self._len: Optional[int] = None
 
     def __iter__(self) -> Iterator[StreamWrapper]:
         for asset in self.source_datapipe:
@@ -139,4 +148,6 @@ class XpySTACAssetReaderIterDataPipe(IterDataPipe[StreamWrapper]):
             )
 
     def __len__(self) -> int:
-        return len(self.source_datapipe)
+        if self._len is None:
+            self._len = len(self.source_datapipe)
+        return self._len
@@ -1,6 +1,8 @@
 """
 Tests for datashader datapipes.
 """
+import copy
+
 import numpy as np
 import pytest
 import xarray as xr
@@ -10,12 +12,22 @@ from zen3geo.datapipes import DatashaderRasterizer, XarrayCanvas
 
 datashader = pytest.importorskip("datashader")
 
+# Mapping from a geometry kind to the single-part and multi-part geom_type
+# names, used to filter the mixed-type geodataframe fixture without regexes
+_GEOM_KIND: dict = {
+    "Point": ("Point", "MultiPoint"),
+    "Line": ("LineString", "MultiLineString"),
+    "Polygon": ("Polygon", "MultiPolygon"),
+}
+
 
 # %%
-@pytest.fixture(scope="function", name="canvas")
+@pytest.fixture(scope="module", name="canvas")
 def fixture_canvas():
     """
-    The blank datashader.Canvas to use in the tests.
+    The blank datashader.Canvas to use in the tests, shared across the module
+    since a Canvas is just a cheap-to-reuse configuration object. Tests that
+    need to mutate it (e.g. unsetting crs) should work on a copy.copy first.
     """
     canvas = datashader.Canvas(
         plot_width=14, plot_height=10, x_range=(1, 8), y_range=(0, 5)
@@ -44,6 +56,32 @@ def fixture_geodataframe():
     return geodataframe
 
 
+@pytest.fixture(scope="module", name="geocollection")
+def fixture_geocollection(geodataframe):
+    """
+    A geopandas.GeoSeries containing a single shapely GeometryCollection that
+    merges the points, lines and polygons of the geodataframe fixture. Module
+    scoped so the GEOS unary_union runs once rather than on every test call.
+    """
+    gpd = pytest.importorskip("geopandas")
+
+    geocollection = gpd.GeoSeries(data=geodataframe.unary_union)
+    geocollection = geocollection.set_crs(crs="OGC:CRS84")
+
+    return geocollection
+
+
+def _rasterize_pipe(canvas, vector, **kwargs):
+    """
+    Build a small canvas + vector datapipe pair chained through
+    rasterize_with_datashader, shared by the tests below to avoid repeating
+    the IterableWrapper boilerplate.
+    """
+    dp_canvas = IterableWrapper(iterable=[canvas])
+    dp_vector = IterableWrapper(iterable=[vector])
+    return dp_canvas.rasterize_with_datashader(vector_datapipe=dp_vector, **kwargs)
+
+
 # %%
 def test_datashader_canvas_dataset():
     """
@@ -85,7 +123,7 @@ def test_datashader_rasterize_vector_geometry(canvas, geodataframe, geom_type, s
     """
     dp = IterableWrapper(iterable=[canvas, canvas])
 
-    vector = geodataframe[geodataframe.type.str.contains(geom_type)]
+    vector = geodataframe[geodataframe.geom_type.isin(values=_GEOM_KIND[geom_type])]
     dp_vector = IterableWrapper(iterable=[vector])
 
     # Using class constructors
@@ -97,22 +135,146 @@ def test_datashader_rasterize_vector_geometry(canvas, geodataframe, geom_type, s
     it = iter(dp_datashader)
     dataarray = next(it)
 
-    assert dataarray.data.sum() == sum_val
+    assert dataarray.sum().item() == sum_val
+    assert dataarray.dims == ("y", "x")
+    assert dataarray.rio.crs == "OGC:CRS84"
+    assert dataarray.rio.shape == (10, 14)
+    assert dataarray.rio.transform().e == -0.5
+
+
+def test_datashader_rasterize_singlepart_points(canvas):
+    """
+    Ensure that DatashaderRasterizer works to rasterize a
+    geopandas.GeoDataFrame of single-part Point geometries, which takes a
+    fast path through a plain pandas.DataFrame with x/y columns.
+    """
+    gpd = pytest.importorskip("geopandas")
+    shapely = pytest.importorskip("shapely")
+
+    vector = gpd.GeoDataFrame(
+        data={
+            "geometry": [
+                shapely.geometry.Point(4.5, 4.5),
+                shapely.geometry.Point(3.5, 1),
+                shapely.geometry.Point(6, 3.5),
+            ]
+        },
+        crs="OGC:CRS84",
+    )
+    dp_datashader = _rasterize_pipe(canvas=canvas, vector=vector)
+
+    assert len(dp_datashader) == 1
+    it = iter(dp_datashader)
+    dataarray = next(it)
+
+    assert dataarray.sum().item() == 3
     assert dataarray.dims == ("y", "x")
     assert dataarray.rio.crs == "OGC:CRS84"
     assert dataarray.rio.shape == (10, 14)
     assert dataarray.rio.transform().e == -0.5
 
 
+def test_datashader_rasterize_vector_outside_canvas(canvas, geodataframe):
+    """
+    Ensure that DatashaderRasterizer produces the same raster when the input
+    vector contains extra geometries lying fully outside of the canvas extent,
+    which get pre-filtered away before rasterization.
+    """
+    gpd = pytest.importorskip("geopandas")
+    shapely = pytest.importorskip("shapely")
+
+    # Add an out-of-bounds point to the point geometries
+    points = geodataframe[geodataframe.geom_type.isin(values=_GEOM_KIND["Point"])]
+    outside = gpd.GeoDataFrame(
+        data={"geometry": [shapely.geometry.Point(99.0, 99.0)]}, crs="OGC:CRS84"
+    )
+    vector = gpd.pd.concat(objs=[points, outside])
+
+    dp_datashader = _rasterize_pipe(canvas=canvas, vector=vector)
+
+    assert len(dp_datashader) == 1
+    it = iter(dp_datashader)
+    dataarray = next(it)
+
+    assert dataarray.sum().item() == 3
+    assert dataarray.rio.shape == (10, 14)
+    assert dataarray.rio.crs == "OGC:CRS84"
+
+
+def test_datashader_rasterize_chunks(canvas, geodataframe):
+    """
+    Ensure that DatashaderRasterizer with a chunks setting produces a lazy
+    dask-backed xarray.DataArray raster.
+    """
+    dask = pytest.importorskip("dask")
+
+    vector = geodataframe[geodataframe.geom_type.isin(values=_GEOM_KIND["Point"])]
+    dp_datashader = _rasterize_pipe(
+        canvas=canvas, vector=vector, chunks={"y": 5, "x": 7}
+    )
+
+    assert len(dp_datashader) == 1
+    it = iter(dp_datashader)
+    dataarray = next(it)
+
+    assert isinstance(dataarray.data, dask.array.Array)
+    assert dataarray.chunks == ((5, 5), (7, 7))
+    assert dataarray.sum().compute().item() == 3
+    assert dataarray.rio.crs == "OGC:CRS84"
+
+
+def test_datashader_rasterize_scheduler(canvas, geodataframe):
+    """
+    Ensure that DatashaderRasterizer with a scheduler setting rasterizes
+    canvas/vector pairs through dask while still yielding correct rasters in
+    the original order, and that the num_threads pin works alongside it.
+    """
+    pytest.importorskip("dask")
+
+    dp = IterableWrapper(iterable=[canvas, canvas])
+    vector = geodataframe[geodataframe.geom_type.isin(values=_GEOM_KIND["Point"])]
+    dp_vector = IterableWrapper(iterable=[vector])
+    dp_datashader = dp.rasterize_with_datashader(
+        vector_datapipe=dp_vector, scheduler="threads", num_threads=1
+    )
+
+    assert len(dp_datashader) == 2
+    dataarrays = list(dp_datashader)
+    for dataarray in dataarrays:
+        assert dataarray.sum().item() == 3
+        assert dataarray.rio.shape == (10, 14)
+        assert dataarray.rio.crs == "OGC:CRS84"
+
+
+def test_datashader_rasterize_max_canvas_pixels(canvas, geodataframe):
+    """
+    Ensure that DatashaderRasterizer with a max_canvas_pixels budget
+    rasterizes at a reduced resolution and upsamples back to the full
+    canvas grid.
+    """
+    vector = geodataframe[geodataframe.geom_type.isin(values=_GEOM_KIND["Point"])]
+    # Canvas is 14x10=140 pixels, budget of 35 gives a 7x5 aggregation grid
+    dp_datashader = _rasterize_pipe(canvas=canvas, vector=vector, max_canvas_pixels=35)
+
+    assert len(dp_datashader) == 1
+    it = iter(dp_datashader)
+    dataarray = next(it)
+
+    # Each 1x1 coarse pixel is replicated into 2x2 fine pixels
+    assert dataarray.sum().item() == 3 * 4
+    assert dataarray.rio.shape == (10, 14)
+    assert dataarray.rio.crs == "OGC:CRS84"
+    assert dataarray.rio.transform().e == -0.5
+
+
 def test_datashader_rasterize_canvas_missing_crs(canvas, geodataframe):
     """
     Ensure that DatashaderRasterizer raises an AttributeError when the
     input datashader.Canvas has no crs attribute.
     """
+    canvas = copy.copy(canvas)  # avoid mutating the module-scoped fixture
     canvas.crs = None
-    dp_canvas = IterableWrapper(iterable=[canvas])
-    dp_vector = IterableWrapper(iterable=[geodataframe.geometry])
-    dp_datashader = dp_canvas.rasterize_with_datashader(vector_datapipe=dp_vector)
+    dp_datashader = _rasterize_pipe(canvas=canvas, vector=geodataframe.geometry)
 
     assert len(dp_datashader) == 1
     it = iter(dp_datashader)
@@ -129,9 +291,7 @@ def test_datashader_rasterize_vector_missing_crs(canvas, geodataframe):
     """
     vector = geodataframe.geometry
     vector.crs = None
-    dp_canvas = IterableWrapper(iterable=[canvas])
-    dp_vector = IterableWrapper(iterable=[vector])
-    dp_datashader = dp_canvas.rasterize_with_datashader(vector_datapipe=dp_vector)
+    dp_datashader = _rasterize_pipe(canvas=canvas, vector=vector)
 
     assert len(dp_datashader) == 1
     it = iter(dp_datashader)
@@ -152,20 +312,12 @@ def test_datashader_rasterize_unmatched_lengths(canvas, geodataframe):
         dp_datashader = dp_canvas.rasterize_with_datashader(vector_datapipe=dp_vector)
 
 
-def test_datashader_rasterize_vector_geometrycollection(canvas, geodataframe):
+def test_datashader_rasterize_vector_geometrycollection(canvas, geocollection):
     """
     Ensure that DatashaderRasterizer raises a NotImplementedError when an
     unsupported vector type like GeometryCollection is used.
     """
-    gpd = pytest.importorskip("geopandas")
-
-    # Merge points, lines and polygons into a single GeometryCollection
-    geocollection = gpd.GeoSeries(data=geodataframe.unary_union)
-    geocollection = geocollection.set_crs(crs="OGC:CRS84")
-
-    dp = IterableWrapper(iterable=[canvas])
-    dp_vector = IterableWrapper(iterable=[geocollection])
-    dp_datashader = dp.rasterize_with_datashader(vector_datapipe=dp_vector)
+    dp_datashader = _rasterize_pipe(canvas=canvas, vector=geocollection)
 
     assert len(dp_datashader) == 1
     it = iter(dp_datashader)
@@ -184,9 +336,7 @@ def test_datashader_rasterize_invalid_vector(canvas, geodataframe):
     gdf_none = geodataframe.loc[5:]
     gdf_none = gdf_none.set_crs(crs="OGC:CRS84")
 
-    dp = IterableWrapper(iterable=[canvas])
-    dp_vector = IterableWrapper(iterable=[gdf_none])
-    dp_datashader = dp.rasterize_with_datashader(vector_datapipe=dp_vector)
+    dp_datashader = _rasterize_pipe(canvas=canvas, vector=gdf_none)
 
     assert len(dp_datashader) == 1
     it = iter(dp_datashader)
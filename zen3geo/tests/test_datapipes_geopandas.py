@@ -11,6 +11,21 @@ from zen3geo.datapipes import GeoPandasRectangleClipper
 gpd = pytest.importorskip("geopandas")
 shapely = pytest.importorskip("shapely")
 
+# Expected bounds of the reprojected vector and raster outputs. Compared with
+# a relative tolerance since the exact floats depend on the PROJ/GDAL version
+EXPECTED_VECTOR_BOUNDS_3857 = np.array(
+    [0.0, 0.0, 166988.3675623712, 166998.31375292226]
+)
+EXPECTED_RASTER_BOUNDS_3857 = np.array(
+    [-166979.23618991036, -55646.75541526544, 166988.3675623712, 166998.31375292226]
+)
+EXPECTED_VECTOR_BOUNDS_32631 = np.array(
+    [444414.4114896285, 276009.81064532325, 611163.137304327, 442194.9725083875]
+)
+EXPECTED_RASTER_BOUNDS_32631 = np.array(
+    [444414.4114896285, 276009.81064532325, 777205.5384580799, 497870.56195762416]
+)
+
 # %%
 @pytest.fixture(scope="module", name="geodataframe")
 def fixture_geodataframe():
@@ -28,10 +43,11 @@ def fixture_geodataframe():
     return geodataframe
 
 
-@pytest.fixture(scope="function", name="dataset")
+@pytest.fixture(scope="module", name="dataset")
 def fixture_dataset():
     """
-    The sample xarray.Dataset to use in the tests.
+    The sample xarray.Dataset to use in the tests. Module-scoped since the
+    tests only read from it.
     """
     dataarray = xr.DataArray(
         data=np.ones(shape=(1, 5, 7)),
@@ -49,6 +65,23 @@ def fixture_dataset():
     return dataset
 
 
+@pytest.fixture(scope="module", name="reprojected_masks")
+def fixture_reprojected_masks(dataset):
+    """
+    Clipped and reprojected copies of the sample xarray.Dataset in EPSG:3857
+    and EPSG:32631, computed once per module since the GDAL warp behind
+    rio.reproject is the most expensive step in this test file.
+    """
+    dataset_3857 = dataset.rio.clip_box(minx=-1, miny=0, maxx=1, maxy=1).rio.reproject(
+        "EPSG:3857"
+    )
+    dataset_32631 = dataset.rio.clip_box(minx=3, miny=3, maxx=5, maxy=4).rio.reproject(
+        "EPSG:32631"
+    )
+
+    return dataset_3857, dataset_32631
+
+
 # %%
 def test_geopandas_rectangle_clipper_geoseries_dataset(geodataframe, dataset):
     """
@@ -90,7 +123,7 @@ def test_geopandas_rectangle_clipper_geoseries_dataset(geodataframe, dataset):
     assert raster_chip.rio.crs == "OGC:CRS84"
 
 
-def test_geopandas_rectangle_clipper_different_crs(geodataframe, dataset):
+def test_geopandas_rectangle_clipper_different_crs(geodataframe, reprojected_masks):
     """
     Ensure that GeoPandasRectangleClipper works to clip a geopandas.GeoSeries
     vector with xarray.Dataset rasters which have different coordinate
@@ -100,12 +133,7 @@ def test_geopandas_rectangle_clipper_different_crs(geodataframe, dataset):
     """
     dp_vector = IterableWrapper(iterable=[geodataframe.geometry])
 
-    dataset_3857 = dataset.rio.clip_box(minx=-1, miny=0, maxx=1, maxy=1).rio.reproject(
-        "EPSG:3857"
-    )
-    dataset_32631 = dataset.rio.clip_box(minx=3, miny=3, maxx=5, maxy=4).rio.reproject(
-        "EPSG:32631"
-    )
+    dataset_3857, dataset_32631 = reprojected_masks
     dp_raster = IterableWrapper(iterable=[dataset_3857, dataset_32631])
 
     # Using class constructors
@@ -122,36 +150,28 @@ def test_geopandas_rectangle_clipper_different_crs(geodataframe, dataset):
     assert clipped_geoseries.crs == "EPSG:3857"
     assert all(clipped_geoseries.geom_type == "Polygon")
     assert clipped_geoseries.shape == (1,)
-    assert clipped_geoseries[0].bounds == (
-        0.0,
-        0.0,
-        166988.3675623712,
-        166998.31375292226,
+    np.testing.assert_allclose(
+        actual=clipped_geoseries[0].bounds,
+        desired=EXPECTED_VECTOR_BOUNDS_3857,
+        rtol=1e-9,
     )
     assert raster_chip.dims == {"band": 1, "y": 2, "x": 3}
-    assert raster_chip.rio.bounds() == (
-        -166979.23618991036,
-        -55646.75541526544,
-        166988.3675623712,
-        166998.31375292226,
+    np.testing.assert_allclose(
+        actual=raster_chip.rio.bounds(), desired=EXPECTED_RASTER_BOUNDS_3857, rtol=1e-9
     )
     assert raster_chip.rio.crs == "EPSG:3857"
 
     clipped_geoseries, raster_chip = next(it)
     assert clipped_geoseries.crs == "EPSG:32631"
     assert clipped_geoseries.shape == (1,)
-    assert clipped_geoseries[1].bounds == (
-        444414.4114896285,
-        276009.81064532325,
-        611163.137304327,
-        442194.9725083875,
+    np.testing.assert_allclose(
+        actual=clipped_geoseries[1].bounds,
+        desired=EXPECTED_VECTOR_BOUNDS_32631,
+        rtol=1e-9,
     )
     assert raster_chip.dims == {"band": 1, "y": 2, "x": 3}
-    assert raster_chip.rio.bounds() == (
-        444414.4114896285,
-        276009.81064532325,
-        777205.5384580799,
-        497870.56195762416,
+    np.testing.assert_allclose(
+        actual=raster_chip.rio.bounds(), desired=EXPECTED_RASTER_BOUNDS_32631, rtol=1e-9
     )
     assert raster_chip.rio.crs == "EPSG:32631"
 
@@ -1,6 +1,8 @@
 """
 Tests for pyogrio datapipes.
 """
+import urllib.request
+
 import pytest
 from torchdata.datapipes.iter import IterableWrapper
 
@@ -8,14 +10,29 @@ from zen3geo.datapipes import PyogrioReader
 
 pyogrio = pytest.importorskip("pyogrio")
 
+
 # %%
-def test_pyogrio_reader():
+@pytest.fixture(scope="session", name="gpkg_path")
+def fixture_gpkg_path(tmp_path_factory):
+    """
+    Path to a GeoPackage file with null values, downloaded once per test
+    session instead of refetched over the network on every test run.
+    """
+    file_url: str = "https://github.com/geopandas/pyogrio/raw/v0.4.0/pyogrio/tests/fixtures/test_gpkg_nulls.gpkg"
+    filepath = tmp_path_factory.mktemp(basename="pyogrio") / "test_gpkg_nulls.gpkg"
+    urllib.request.urlretrieve(url=file_url, filename=filepath)
+
+    return str(filepath)
+
+
+# %%
+@pytest.mark.network
+def test_pyogrio_reader(gpkg_path):
     """
     Ensure that PyogrioReader works to read in a GeoPackage file and outputs a
     geopandas.GeoDataFrame object.
     """
-    file_url: str = "https://github.com/geopandas/pyogrio/raw/v0.4.0/pyogrio/tests/fixtures/test_gpkg_nulls.gpkg"
-    dp = IterableWrapper(iterable=[file_url])
+    dp = IterableWrapper(iterable=[gpkg_path])
 
     # Using class constructors
     dp_pyogrio = PyogrioReader(source_datapipe=dp)
@@ -29,3 +46,59 @@ def test_pyogrio_reader():
     assert geodataframe.shape == (4, 12)
     assert any(geodataframe.isna())
     assert all(geodataframe.geom_type == "Point")
+
+
+def test_pyogrio_reader_num_workers(tmp_path):
+    """
+    Ensure that PyogrioReader with num_workers set reads multiple files in
+    parallel threads while still yielding outputs in order.
+    """
+    gpd = pytest.importorskip("geopandas")
+    shapely = pytest.importorskip("shapely")
+
+    filenames: list = []
+    for i in range(3):
+        geodataframe = gpd.GeoDataFrame(
+            data={"col": [i], "geometry": [shapely.geometry.Point(i, i)]},
+            crs="EPSG:4326",
+        )
+        filename = str(tmp_path / f"point{i}.gpkg")
+        pyogrio.write_dataframe(df=geodataframe, path=filename)
+        filenames.append(filename)
+
+    dp = IterableWrapper(iterable=filenames)
+    dp_pyogrio = dp.read_from_pyogrio(num_workers=2)
+
+    assert len(dp_pyogrio) == 3
+    for i, geodataframe in enumerate(dp_pyogrio):
+        assert geodataframe.shape == (1, 2)
+        assert geodataframe.col[0] == i
+
+
+def test_pyogrio_reader_chunk_size(tmp_path):
+    """
+    Ensure that PyogrioReader with chunk_size set splits a large file into
+    several smaller GeoDataFrame chunks covering all features in order.
+    """
+    gpd = pytest.importorskip("geopandas")
+    shapely = pytest.importorskip("shapely")
+
+    geodataframe = gpd.GeoDataFrame(
+        data={
+            "col": list(range(5)),
+            "geometry": [shapely.geometry.Point(i, i) for i in range(5)],
+        },
+        crs="EPSG:4326",
+    )
+    filename = str(tmp_path / "points.gpkg")
+    pyogrio.write_dataframe(df=geodataframe, path=filename)
+
+    dp = IterableWrapper(iterable=[filename])
+    dp_pyogrio = dp.read_from_pyogrio(chunk_size=2)
+
+    with pytest.raises(TypeError, match="doesn't have valid length"):
+        len(dp_pyogrio)
+
+    chunks = list(dp_pyogrio)
+    assert [chunk.shape[0] for chunk in chunks] == [2, 2, 1]
+    assert gpd.pd.concat(objs=chunks).col.tolist() == [0, 1, 2, 3, 4]
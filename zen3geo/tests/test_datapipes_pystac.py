@@ -1,6 +1,8 @@
 """
 Tests for pystac datapipes.
 """
+import datetime
+
 import pytest
 from torchdata.datapipes.iter import IterableWrapper
 
@@ -8,7 +10,24 @@ from zen3geo.datapipes import PySTACItemReader
 
 pystac = pytest.importorskip("pystac")
 
+
+def _save_local_item(item_path: str, item_id: str):
+    """
+    Save a minimal STAC item JSON file to the given path for tests that read
+    items from local disk.
+    """
+    item = pystac.Item(
+        id=item_id,
+        geometry={"type": "Point", "coordinates": [103.7, 1.3]},
+        bbox=[103.7, 1.3, 103.7, 1.3],
+        datetime=datetime.datetime(2022, 1, 15, 3, 21, 1),
+        properties={},
+    )
+    item.save_object(include_self_link=False, dest_href=item_path)
+
+
 # %%
+@pytest.mark.network
 def test_pystac_item_reader():
     """
     Ensure that PySTACItemReader works to read in a JSON STAC item and outputs
@@ -45,3 +64,93 @@ def test_pystac_item_reader():
         stac_item.assets["analytic"].extra_fields["product"]
         == "http://cool-sat.com/catalog/products/analytic.json"
     )
+
+
+def test_pystac_item_reader_local_file(tmp_path):
+    """
+    Ensure that PySTACItemReader works to read a STAC item from a local JSON
+    file, taking the non-http fallback of the default keep-alive session
+    based StacIO reader.
+    """
+    import datetime
+
+    item = pystac.Item(
+        id="local-item",
+        geometry={"type": "Point", "coordinates": [103.7, 1.3]},
+        bbox=[103.7, 1.3, 103.7, 1.3],
+        datetime=datetime.datetime(2022, 1, 15, 3, 21, 1),
+        properties={},
+    )
+    item_path = str(tmp_path / "local-item.json")
+    item.save_object(include_self_link=False, dest_href=item_path)
+
+    dp = IterableWrapper(iterable=[item_path])
+    dp_pystac = dp.read_to_pystac_item()
+
+    assert len(dp_pystac) == 1
+    it = iter(dp_pystac)
+    stac_item = next(it)
+
+    assert stac_item.id == "local-item"
+    assert stac_item.bbox == [103.7, 1.3, 103.7, 1.3]
+
+
+def test_pystac_item_reader_num_workers(tmp_path):
+    """
+    Ensure that PySTACItemReader with a num_workers setting reads STAC items
+    concurrently while still yielding outputs in the original input order.
+    """
+    item_paths = []
+    for i in range(3):
+        item_path = str(tmp_path / f"item-{i}.json")
+        _save_local_item(item_path=item_path, item_id=f"item-{i}")
+        item_paths.append(item_path)
+
+    dp = IterableWrapper(iterable=item_paths)
+    dp_pystac = dp.read_to_pystac_item(num_workers=2)
+
+    assert len(dp_pystac) == 3
+    stac_items = list(dp_pystac)
+    assert [stac_item.id for stac_item in stac_items] == [
+        "item-0",
+        "item-1",
+        "item-2",
+    ]
+
+
+def test_pystac_item_reader_cache_path(tmp_path):
+    """
+    Ensure that PySTACItemReader with a cache_path setting wires a
+    requests_cache.CachedSession into the StacIO reader and still reads STAC
+    items correctly.
+    """
+    requests_cache = pytest.importorskip("requests_cache")
+
+    item_path = str(tmp_path / "cached-item.json")
+    _save_local_item(item_path=item_path, item_id="cached-item")
+
+    dp = IterableWrapper(iterable=[item_path])
+    dp_pystac = dp.read_to_pystac_item(
+        cache_path=str(tmp_path / "stac_cache"), cache_ttl=60
+    )
+
+    stac_io = dp_pystac.kwargs["stac_io"]
+    assert isinstance(stac_io._session, requests_cache.CachedSession)
+
+    it = iter(dp_pystac)
+    stac_item = next(it)
+    assert stac_item.id == "cached-item"
+
+
+def test_pystac_item_reader_cache_path_missing_requests_cache(monkeypatch):
+    """
+    Ensure that PySTACItemReader raises a ModuleNotFoundError when the
+    cache_path setting is used but requests_cache is not installed.
+    """
+    from zen3geo.datapipes import pystac as pystac_module
+
+    monkeypatch.setattr(pystac_module, "requests_cache", None)
+
+    dp = IterableWrapper(iterable=["local-item.json"])
+    with pytest.raises(ModuleNotFoundError, match="requests_cache"):
+        dp.read_to_pystac_item(cache_path=".zen3geo_stac")
@@ -10,6 +10,7 @@ pystac_client = pytest.importorskip("pystac_client")
 
 
 # %%
+@pytest.mark.network
 def test_pystac_client_item_search():
     """
     Ensure that PySTACAPISearcher works to query a STAC API /search/ endpoint
@@ -58,6 +59,7 @@ def test_pystac_client_item_search():
     assert stac_item.assets["nidem"].extra_fields["eo:bands"] == [{"name": "nidem"}]
 
 
+@pytest.mark.network
 def test_pystac_client_item_search_open_headers():
     """
     Ensure that PySTACAPISearcher works to query a STAC API /search/ endpoint
@@ -89,6 +91,7 @@ def test_pystac_client_item_search_open_headers():
     assert stac_item_search.client.description == "Root catalog for LPCLOUD"
 
 
+@pytest.mark.network
 def test_pystac_client_item_lister():
     """
     Ensure that PySTACAPIItemLister works to yield pystac.Item instances for
@@ -174,3 +177,38 @@ def test_pystac_client_item_lister():
             "full_width_half_max": 0.098,
         },
     ]
+
+
+def test_pystac_client_item_search_cache_path(tmp_path):
+    """
+    Ensure that PySTACAPISearcher with a cache_path setting swaps the HTTP
+    session inside pystac-client's StacApiIO for a disk-backed
+    requests_cache.CachedSession.
+    """
+    requests_cache = pytest.importorskip("requests_cache")
+
+    query: dict = dict(collections=["sentinel-2-l2a"])
+    dp = IterableWrapper(iterable=[query])
+    dp_pystac_client = dp.search_for_pystac_item(
+        catalog_url="https://example.com/stac/",
+        cache_path=str(tmp_path / "stac_cache"),
+    )
+
+    stac_io = dp_pystac_client.kwargs["stac_io"]
+    assert isinstance(stac_io.session, requests_cache.CachedSession)
+
+
+def test_pystac_client_item_search_cache_path_missing_requests_cache(monkeypatch):
+    """
+    Ensure that PySTACAPISearcher raises a ModuleNotFoundError when cache_path
+    is set but the optional requests-cache package is not installed.
+    """
+    from zen3geo.datapipes import pystac_client as pystac_client_module
+
+    monkeypatch.setattr(pystac_client_module, "requests_cache", None)
+
+    dp = IterableWrapper(iterable=[dict(collections=["sentinel-2-l2a"])])
+    with pytest.raises(ModuleNotFoundError, match="requests_cache"):
+        dp.search_for_pystac_item(
+            catalog_url="https://example.com/stac/", cache_path=".zen3geo_stac"
+        )
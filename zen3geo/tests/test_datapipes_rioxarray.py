@@ -1,19 +1,59 @@
 """
 Tests for rioxarray datapipes.
 """
+import numpy as np
+import pytest
+import rasterio
 from torchdata.datapipes.iter import IterableWrapper
 
 from zen3geo.datapipes import RioXarrayReader
 
 
 # %%
-def test_rioxarray_reader():
+def _write_geotiff(filepath, fill_value: float = 1.0):
+    """
+    Write a small 16x16 single-band float32 GeoTIFF file filled with the given
+    value to the given path.
+    """
+    with rasterio.open(
+        fp=filepath,
+        mode="w",
+        driver="GTiff",
+        width=16,
+        height=16,
+        count=1,
+        dtype="float32",
+        crs="EPSG:4326",
+        transform=rasterio.transform.from_bounds(
+            west=0, south=0, east=16, north=16, width=16, height=16
+        ),
+        tiled=True,
+        compress="deflate",
+    ) as dataset:
+        dataset.write(
+            np.full(shape=(1, 16, 16), fill_value=fill_value, dtype="float32")
+        )
+
+
+@pytest.fixture(scope="session", name="geotiff_path")
+def fixture_geotiff_path(tmp_path_factory):
+    """
+    Path to a small 16x16 single-band float32 GeoTIFF file, written once per
+    test session so that tests do not need to fetch rasters over the network.
+    """
+    filepath = tmp_path_factory.mktemp(basename="raster") / "geotiff.tif"
+    _write_geotiff(filepath=filepath)
+
+    return str(filepath)
+
+
+# %%
+def test_rioxarray_reader(geotiff_path):
     """
     Ensure that RioXarrayReader works to read in a GeoTIFF file and outputs an
     xarray.DataArray object.
     """
-    file_url: str = "https://github.com/GenericMappingTools/gmtserver-admin/raw/master/cache/earth_day_HD.tif"
-    dp = IterableWrapper(iterable=[file_url])
+    dp = IterableWrapper(iterable=[geotiff_path])
 
     # Using class constructors
     dp_rioxarray = RioXarrayReader(source_datapipe=dp)
@@ -24,5 +64,50 @@ def test_rioxarray_reader():
     it = iter(dp_rioxarray)
     dataarray = next(it)
 
-    assert dataarray.shape == (1, 960, 1920)
+    assert dataarray.shape == (1, 16, 16)
     assert dataarray.dims == ("band", "y", "x")
+    assert dataarray.rio.crs == "EPSG:4326"
+
+
+def test_rioxarray_reader_num_workers(tmp_path):
+    """
+    Ensure that RioXarrayReader with a num_workers setting reads GeoTIFF files
+    concurrently while still yielding outputs in the original input order.
+    """
+    filepaths = []
+    for i in range(3):
+        filepath = tmp_path / f"geotiff_{i}.tif"
+        _write_geotiff(filepath=filepath, fill_value=float(i))
+        filepaths.append(str(filepath))
+
+    dp = IterableWrapper(iterable=filepaths)
+    dp_rioxarray = dp.read_from_rioxarray(num_workers=2)
+
+    assert len(dp_rioxarray) == 3
+    dataarrays = list(dp_rioxarray)
+    for i, dataarray in enumerate(dataarrays):
+        assert dataarray.shape == (1, 16, 16)
+        assert dataarray.mean() == float(i)
+
+
+def test_rioxarray_reader_no_wrap_stream_gdal_env(geotiff_path):
+    """
+    Ensure that RioXarrayReader with wrap_stream=False yields plain
+    xarray.DataArray objects instead of StreamWrapper ones, and that reading
+    works inside a custom gdal_env GDAL configuration.
+    """
+    import xarray as xr
+    from torchdata.datapipes.utils import StreamWrapper
+
+    dp = IterableWrapper(iterable=[geotiff_path])
+    dp_rioxarray = dp.read_from_rioxarray(
+        wrap_stream=False, gdal_env={"GDAL_CACHEMAX": 64}
+    )
+
+    it = iter(dp_rioxarray)
+    dataarray = next(it)
+
+    assert not isinstance(dataarray, StreamWrapper)
+    assert isinstance(dataarray, xr.DataArray)
+    assert dataarray.shape == (1, 16, 16)
+    assert dataarray.rio.crs == "EPSG:4326"
@@ -1,12 +1,14 @@
 """
 Tests for stackstac datapipes.
 """
+import datetime
+
 import numpy as np
 import pytest
 import xarray as xr
 from torchdata.datapipes.iter import IterableWrapper
 
-from zen3geo.datapipes import StackSTACStacker
+from zen3geo.datapipes import StackSTACMosaicker, StackSTACStacker
 
 pystac = pytest.importorskip("pystac")
 stackstac = pytest.importorskip("stackstac")
@@ -25,6 +27,89 @@ def test_stackstac_mosaicker():
     assert dataarray.sum() == 1 * 32 * 32
 
 
+def test_stackstac_mosaicker_compute_batch_drop_coords():
+    """
+    Ensure that StackSTACMosaicker with compute_batch and drop_coords settings
+    yields eagerly computed mosaics with the non-dimension coordinates removed.
+    """
+    dask = pytest.importorskip("dask")
+
+    datacube: xr.DataArray = xr.DataArray(
+        data=np.ones(shape=(3, 1, 32, 32)),
+        dims=["tile", "band", "y", "x"],
+        coords={"id": ("tile", ["tile-0", "tile-1", "tile-2"])},
+    ).chunk(chunks={"tile": 1})
+    dp = IterableWrapper(iterable=[datacube, datacube, datacube])
+    dp_mosaic = dp.mosaic_dataarray(dim="tile", compute_batch=2, drop_coords=True)
+
+    assert len(dp_mosaic) == 3
+    dataarrays = list(dp_mosaic)
+    for dataarray in dataarrays:
+        assert not isinstance(dataarray.data, dask.array.Array)
+        assert dataarray.sizes == {"band": 1, "y": 32, "x": 32}
+        assert dataarray.sum() == 1 * 32 * 32
+        assert "id" not in dataarray.coords
+
+
+def _local_stac_item() -> "pystac.Item":
+    """
+    A minimal STAC item carrying the projection metadata (epsg, shape,
+    transform) that stackstac.stack needs to build a lazy datacube without
+    touching the asset href.
+    """
+    item = pystac.Item(
+        id="local-item",
+        geometry={
+            "type": "Polygon",
+            "coordinates": [
+                [[0.0, 0.0], [16.0, 0.0], [16.0, 16.0], [0.0, 16.0], [0.0, 0.0]]
+            ],
+        },
+        bbox=[0.0, 0.0, 16.0, 16.0],
+        datetime=datetime.datetime(2022, 1, 15, 3, 21, 1),
+        properties={
+            "proj:epsg": 32648,
+            "proj:shape": [16, 16],
+            "proj:transform": [1.0, 0.0, 0.0, 0.0, -1.0, 16.0],
+        },
+    )
+    item.add_asset(
+        key="B02",
+        asset=pystac.Asset(
+            href="local-B02.tif",
+            media_type=pystac.MediaType.GEOTIFF,
+            roles=["data"],
+        ),
+    )
+    return item
+
+
+def test_stackstac_stacker_rechunk_cast():
+    """
+    Ensure that StackSTACStacker with rechunk_to, drop_coords and cast_to
+    settings applies the new chunking, coordinate dropping and dtype lazily
+    at the stack boundary, without computing the datacube.
+    """
+    stac_item = _local_stac_item()
+    dp = IterableWrapper(iterable=[stac_item])
+    dp_stackstac = dp.stack_stac_items(
+        rechunk_to={"time": -1, "y": 8, "x": 8},
+        drop_coords=True,
+        cast_to=np.float16,
+    )
+
+    assert len(dp_stackstac) == 1
+    it = iter(dp_stackstac)
+    datacube = next(it)
+
+    assert datacube.sizes == {"time": 1, "band": 1, "y": 16, "x": 16}
+    assert datacube.chunksizes["y"] == (8, 8)
+    assert datacube.chunksizes["x"] == (8, 8)
+    assert datacube.dtype == np.float16
+    assert "id" not in datacube.coords
+
+
+@pytest.mark.network
 def test_stackstac_stacker():
     """
     Ensure that StackSTACStacker works to stack multiple bands within a STAC
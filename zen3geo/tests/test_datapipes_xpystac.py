@@ -8,6 +8,7 @@ from zen3geo.datapipes import XpySTACAssetReader
 
 
 # %%
+@pytest.mark.network
 def test_xpystac_asset_reader_cog():
     """
     Ensure that XpySTACAssetReader works to read in a pystac.Asset object
@@ -38,6 +39,7 @@ def test_xpystac_asset_reader_cog():
     assert dataset.rio.crs == "EPSG:32633"
 
 
+@pytest.mark.network
 def test_xpystac_asset_reader_zarr():
     """
     Ensure that XpySTACAssetReader works to read in a pystac.Asset object
@@ -70,6 +72,7 @@ def test_xpystac_asset_reader_zarr():
     assert dataset.rio.grid_mapping == "lambert_conformal_conic"
 
 
+@pytest.mark.network
 def test_xpystac_asset_reader_geotiff_without_xpystac():
     """
     Ensure that XpySTACAssetReader works to read in a GeoTIFF file and output